@@ -21,6 +21,7 @@
 using Vista.SDK.Transport.Avro.DataChannel;
 using Vista.SDK.Transport.Json;
 using Vista.SDK.Transport.Json.DataChannel;
+using ZstdSharp;
 using DataChannelListJsonPackage = Vista.SDK.Transport.Json.DataChannel.DataChannelListPackage;
 using DataChannelListAvroPackage = Vista.SDK.Transport.Avro.DataChannel.DataChannelListPackage;
 using RunMode = BenchmarkDotNet.Diagnosers.RunMode;
@@ -30,8 +31,11 @@ namespace Vista.SDK.Benchmarks.Transport;
 [ConfigSource]
 public class DataChannelListSerialization
 {
+    // Avro's BinaryEncoder is unbuffered, so it is given a buffer in front of the
+    // compressors to match the chunked writes of JsonSerializer
+    private const int AvroBufferSize = 64 * 1024;
+
     private MemoryStream _memoryStream;
-    private BrotliStream _brotliStream;
     private MemoryStream _compressionStream;
 
     private DataChannelListJsonPackage _jsonPackage;
@@ -139,12 +143,24 @@ public void Setup()
             Avro_Bzip2(compressionLevel);
             _payloadSizes[$"{nameof(Avro_Bzip2)}-{compressionLevel}"] = _compressionStream.Length;
         }
+
+        foreach (var compressionLevelArgs in GetZstdCompressionLevels())
+        {
+            var compressionLevel = (int)compressionLevelArgs[0];
+
+            Json_Zstd(compressionLevel);
+            _payloadSizes[$"{nameof(Json_Zstd)}-{compressionLevel}"] = _compressionStream.Length;
+
+            Avro_Zstd(compressionLevel);
+            _payloadSizes[$"{nameof(Avro_Zstd)}-{compressionLevel}"] = _compressionStream.Length;
+        }
     }
 
     [GlobalCleanup]
     public void Cleanup()
     {
         _memoryStream.Dispose();
+        _compressionStream.Dispose();
     }
 
     [Benchmark(Description = "Json")]
@@ -160,24 +176,39 @@ public void Json()
     [BenchmarkCategory("Bzip2")]
     public void Json_Bzip2(int CompressionLevel)
     {
-        _memoryStream.SetLength(0);
         _compressionStream.SetLength(0);
-        _jsonPackage.Serialize(_memoryStream);
-        _memoryStream.Position = 0;
-        BZip2.Compress(_memoryStream, _compressionStream, false, CompressionLevel);
+        using var bzip2Stream = new BZip2OutputStream(_compressionStream, CompressionLevel)
+        {
+            IsStreamOwner = false
+        };
+        _jsonPackage.Serialize(bzip2Stream);
     }
 
     [Benchmark(Description = "Json")]
     [BenchmarkCategory("Brotli")]
     public void Json_Brotli()
     {
-        _memoryStream.SetLength(0);
         _compressionStream.SetLength(0);
-        _jsonPackage.Serialize(_memoryStream);
-        _memoryStream.Position = 0;
-        _brotliStream = new BrotliStream(_compressionStream, CompressionLevel.SmallestSize, true);
-        _memoryStream.CopyTo(_brotliStream);
-        _brotliStream.Flush();
+        using var brotliStream = new BrotliStream(
+            _compressionStream,
+            CompressionLevel.SmallestSize,
+            true
+        );
+        _jsonPackage.Serialize(brotliStream);
+    }
+
+    [Benchmark(Description = "Json")]
+    [ArgumentsSource(nameof(GetZstdCompressionLevels))]
+    [BenchmarkCategory("Zstd")]
+    public void Json_Zstd(int CompressionLevel)
+    {
+        _compressionStream.SetLength(0);
+        using var zstdStream = new CompressionStream(
+            _compressionStream,
+            CompressionLevel,
+            leaveOpen: true
+        );
+        _jsonPackage.Serialize(zstdStream);
     }
 
     [Benchmark(Description = "Avro")]
@@ -193,24 +224,42 @@ public void Avro()
     [BenchmarkCategory("Bzip2")]
     public void Avro_Bzip2(int CompressionLevel)
     {
-        _memoryStream.SetLength(0);
         _compressionStream.SetLength(0);
-        _avroWriter.Write(_avroPackage, _avroEncoder);
-        _memoryStream.Position = 0;
-        BZip2.Compress(_memoryStream, _compressionStream, false, CompressionLevel);
+        using var bzip2Stream = new BZip2OutputStream(_compressionStream, CompressionLevel)
+        {
+            IsStreamOwner = false
+        };
+        using var bufferedStream = new BufferedStream(bzip2Stream, AvroBufferSize);
+        _avroWriter.Write(_avroPackage, new BinaryEncoder(bufferedStream));
     }
 
     [Benchmark(Description = "Avro")]
     [BenchmarkCategory("Brotli")]
     public void Avro_Brotli()
     {
-        _memoryStream.SetLength(0);
         _compressionStream.SetLength(0);
-        _avroWriter.Write(_avroPackage, _avroEncoder);
-        _memoryStream.Position = 0;
-        _brotliStream = new BrotliStream(_compressionStream, CompressionLevel.SmallestSize, true);
-        _memoryStream.CopyTo(_brotliStream);
-        _brotliStream.Flush();
+        using var brotliStream = new BrotliStream(
+            _compressionStream,
+            CompressionLevel.SmallestSize,
+            true
+        );
+        using var bufferedStream = new BufferedStream(brotliStream, AvroBufferSize);
+        _avroWriter.Write(_avroPackage, new BinaryEncoder(bufferedStream));
+    }
+
+    [Benchmark(Description = "Avro")]
+    [ArgumentsSource(nameof(GetZstdCompressionLevels))]
+    [BenchmarkCategory("Zstd")]
+    public void Avro_Zstd(int CompressionLevel)
+    {
+        _compressionStream.SetLength(0);
+        using var zstdStream = new CompressionStream(
+            _compressionStream,
+            CompressionLevel,
+            leaveOpen: true
+        );
+        using var bufferedStream = new BufferedStream(zstdStream, AvroBufferSize);
+        _avroWriter.Write(_avroPackage, new BinaryEncoder(bufferedStream));
     }
 
     public static IEnumerable<object[]> GetCompressionLevels()
@@ -219,6 +268,13 @@ public static IEnumerable<object[]> GetCompressionLevels()
         yield return new object[] { 9 };
     }
 
+    public static IEnumerable<object[]> GetZstdCompressionLevels()
+    {
+        yield return new object[] { 3 };
+        yield return new object[] { 9 };
+        yield return new object[] { 19 };
+    }
+
     public class PayloadSizeMetric : IMetricDescriptor
     {
         public static readonly PayloadSizeMetric Instance = new PayloadSizeMetric();
@@ -161,7 +161,7 @@ public static void ToString(this VisVersion version, global::System.Text.StringB
                 @"
     public static class VisVersions
     {
-        public static readonly global::System.Collections.Generic.IEnumerable<VisVersion> All = new []
+        public static readonly global::System.Collections.Generic.IEnumerable<VisVersion> All = global::System.Array.AsReadOnly(new []
         {"
             );
 
@@ -176,7 +176,7 @@ public static class VisVersions
 
             sourceBuilder.Append(
                 @"
-        };
+        });
 
         public static VisVersion Parse(string version)
         {
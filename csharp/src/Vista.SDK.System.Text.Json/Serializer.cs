@@ -1,5 +1,7 @@
-﻿using System.Text.Json;
+﻿using System.Text.Encodings.Web;
+using System.Text.Json;
 using System.Text.Json.Serialization;
+using System.Text.Unicode;
 using Vista.SDK.Transport.Json.DataChannel;
 using Vista.SDK.Transport.Json.TimeSeriesData;
 
@@ -8,7 +10,13 @@ namespace Vista.SDK.Transport.Json;
 public static class Serializer
 {
     public static JsonSerializerOptions Options =
-        new() { DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull, };
+        new()
+        {
+            DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull,
+            // Write non-ASCII text as-is instead of as \uXXXX escapes,
+            // HTML-sensitive characters are still escaped
+            Encoder = JavaScriptEncoder.Create(UnicodeRanges.All),
+        };
 
     public static string Serialize(this DataChannelListPackage package) =>
         JsonSerializer.Serialize(package, Options);
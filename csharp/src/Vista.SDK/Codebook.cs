@@ -9,9 +9,6 @@ public sealed record class Codebook
     private readonly CodebookStandardValues _standardValues;
     private readonly CodebookGroups _groups;
 
-    private const string TagAlphabet = "abcdefghijklmnopqrstuvwxyz0123456789.";
-    private const string PositionTagAlphabet = TagAlphabet + "-";
-
     public IReadOnlyDictionary<string, IReadOnlyList<string>> RawData { get; }
 
     internal Codebook(CodebookDto dto)
@@ -75,7 +72,7 @@ internal Codebook(CodebookDto dto)
         }
         else
         {
-            if (!value.All(c => TagAlphabet.Contains(c)))
+            if (!IsValidTagValue(value, allowDash: false))
                 return null;
 
             if (Name != CodebookName.Detail && !StandardValues.Contains(value))
@@ -104,7 +101,7 @@ public PositionValidationResult ValidatePosition(string position)
         if (position.Trim().Length != position.Length)
             return PositionValidationResult.Invalid;
 
-        if (!position.All(c => PositionTagAlphabet.Contains(c)))
+        if (!IsValidTagValue(position, allowDash: true))
             return PositionValidationResult.Invalid;
 
         if (StandardValues.Contains(position))
@@ -152,6 +149,22 @@ public PositionValidationResult ValidatePosition(string position)
 
         return validations.Max();
     }
+
+    // Tag values use the alphabet [a-z0-9.], positions additionally allow '-'
+    private static bool IsValidTagValue(string value, bool allowDash)
+    {
+        foreach (var c in value)
+        {
+            if (c is (>= 'a' and <= 'z') or (>= '0' and <= '9') or '.')
+                continue;
+            if (allowDash && c == '-')
+                continue;
+
+            return false;
+        }
+
+        return true;
+    }
 }
 
 public static class PositionValidationResults
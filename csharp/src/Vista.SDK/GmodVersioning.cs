@@ -23,43 +23,60 @@ internal GmodVersioning(GmodVersioningDto dto)
         VisVersion targetVersion
     )
     {
-        ValidateSourceAndTargetVersions(sourceVersion, targetVersion);
+        var versioningNode = GetVersioningNode(sourceVersion, targetVersion);
+        var targetGmod = VIS.Instance.GetGmod(targetVersion);
 
-        if (!TryGetVersioningNode(sourceVersion.ToVersionString(), out var versioningNode))
-            throw new ArgumentException(
-                "Couldn't get versioning node with VIS version" + sourceVersion.ToVersionString()
-            );
+        return ConvertNode(in versioningNode, targetGmod, sourceNode);
+    }
 
+    private static GmodNode ConvertNode(
+        in GmodVersioningNode versioningNode,
+        Gmod targetGmod,
+        GmodNode sourceNode
+    )
+    {
         var nextCode = versioningNode.TryGetCodeChanges(sourceNode.Code, out var nodeChanges)
           ? nodeChanges.NextCode
           : sourceNode.Code;
 
-        var gmod = VIS.Instance.GetGmod(targetVersion);
-
-        if (!gmod.TryGetNode(nextCode, out var targetNode))
+        if (!targetGmod.TryGetNode(nextCode, out var targetNode))
             throw new ArgumentException("Couldn't get target node with code: " + nextCode);
         return targetNode with { Location = sourceNode.Location };
     }
 
+    private GmodVersioningNode GetVersioningNode(VisVersion sourceVersion, VisVersion targetVersion)
+    {
+        ValidateSourceAndTargetVersions(sourceVersion, targetVersion);
+
+        if (!TryGetVersioningNode(sourceVersion.ToVersionString(), out var versioningNode))
+            throw new ArgumentException(
+                "Couldn't get versioning node with VIS version" + sourceVersion.ToVersionString()
+            );
+
+        return versioningNode;
+    }
+
     public GmodPath ConvertPath(
         VisVersion sourceVersion,
         GmodPath sourcePath,
         VisVersion targetVersion
     )
     {
-        var targetEndNode = ConvertNode(sourceVersion, sourcePath.Node, targetVersion);
+        // Resolve the versioning rules and target gmod once, rather than per path node
+        var versioningNode = GetVersioningNode(sourceVersion, targetVersion);
+        var targetGmod = VIS.Instance.GetGmod(targetVersion);
+
+        var targetEndNode = ConvertNode(in versioningNode, targetGmod, sourcePath.Node);
         if (targetEndNode.IsRoot)
             return new GmodPath(targetEndNode.Parents, targetEndNode);
 
-        var targetGmod = VIS.Instance.GetGmod(targetVersion);
-
         var qualifyingNodes = sourcePath
             .GetFullPath()
             .Select(
                 t =>
                     (
                         SourceNode: t.Node,
-                        TargetNode: ConvertNode(sourceVersion, t.Node, targetVersion)
+                        TargetNode: ConvertNode(in versioningNode, targetGmod, t.Node)
                     )
             )
             .Where(t => t.TargetNode.Code != targetEndNode.Code)
@@ -136,10 +153,6 @@ p with
 
                 targetParents.Insert(0, targetGmod.RootNode);
 
-                var qualifiedParents = qualifyingNodesWithCorrectPath
-                    .Where(n => !targetParents.Any(t => t.Code == n.TargetNode.Code))
-                    .ToList();
-
                 if (
                     !qualifyingNodesWithCorrectPath.All(
                         cn => targetParents.Any(p => p.Code == cn.TargetNode.Code)
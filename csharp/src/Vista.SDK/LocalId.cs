@@ -8,6 +8,8 @@ public class LocalId : ILocalId, IEquatable<LocalId>
 
     private readonly ILocalIdBuilder _builder;
 
+    private string? _string;
+
     internal LocalId(ILocalIdBuilder builder)
     {
         if (builder.IsEmpty)
@@ -70,7 +72,8 @@ public bool Equals(LocalId? other)
 
     public sealed override int GetHashCode() => _builder.GetHashCode();
 
-    public override string ToString() => _builder.ToString();
+    // The builder is immutable, so the string form is built once on first use
+    public override string ToString() => _string ??= _builder.ToString();
 
     public static LocalId Parse(string localIdStr, out LocalIdParsingErrorBuilder errorBuilder) =>
         LocalIdBuilder.Parse(localIdStr, out errorBuilder).Build();
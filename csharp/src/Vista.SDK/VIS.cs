@@ -220,10 +220,7 @@ IEnumerable<VisVersion> visVersions
         return codebooks.ToDictionary(t => t.Version, t => t.Codebooks);
     }
 
-    public IEnumerable<VisVersion> GetVisVersions()
-    {
-        return (VisVersion[])Enum.GetValues(typeof(VisVersion));
-    }
+    public IEnumerable<VisVersion> GetVisVersions() => VisVersions.All;
 
     public GmodNode ConvertNode(
         VisVersion sourceVersion,
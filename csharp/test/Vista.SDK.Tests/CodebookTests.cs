@@ -2,6 +2,8 @@ namespace Vista.SDK.Tests;
 
 public class CodebookTests
 {
+    private static readonly Codebooks _codebooks = VIS.Instance.GetCodebooks(VisVersion.v3_4a);
+
     [Theory]
     [MemberData(
         nameof(VistaSDKTestData.AddValidPositionData),
@@ -9,10 +11,7 @@ public class CodebookTests
     )]
     public void Test_Position_Validation(string input, string expectedOutput)
     {
-        var (_, vis) = VISTests.GetVis();
-        var codebooks = vis.GetCodebooks(VisVersion.v3_4a);
-
-        var codebookType = codebooks[CodebookName.Position];
+        var codebookType = _codebooks[CodebookName.Position];
         var validPosition = codebookType.ValidatePosition(input);
         var parsedExpectedOutput = PositionValidationResults.FromString(expectedOutput);
 
@@ -23,10 +22,7 @@ public void Test_Position_Validation(string input, string expectedOutput)
     [MemberData(nameof(VistaSDKTestData.AddPositionsData), MemberType = typeof(VistaSDKTestData))]
     public void Test_Positions(string invalidStandardValue, string validStandardValue)
     {
-        var (_, vis) = VISTests.GetVis();
-        var codebooks = vis.GetCodebooks(VisVersion.v3_4a);
-
-        var positions = codebooks[CodebookName.Position];
+        var positions = _codebooks[CodebookName.Position];
 
         Assert.False(positions.HasStandardValue(invalidStandardValue));
         Assert.True(positions.HasStandardValue(validStandardValue));
@@ -35,9 +31,7 @@ public void Test_Positions(string invalidStandardValue, string validStandardValu
     [Fact]
     public void Test_Standard_Values()
     {
-        var codebooks = VIS.Instance.GetCodebooks(VisVersion.v3_4a);
-
-        var positions = codebooks[CodebookName.Position];
+        var positions = _codebooks[CodebookName.Position];
 
         Assert.True(positions.HasStandardValue("upper"));
         var rawData = positions.RawData;
@@ -54,10 +48,7 @@ public void Test_Standard_Values()
         string secondValidValue
     )
     {
-        var (_, vis) = VISTests.GetVis();
-        var codebooks = vis.GetCodebooks(VisVersion.v3_4a);
-
-        var states = codebooks[CodebookName.State];
+        var states = _codebooks[CodebookName.State];
         Assert.NotNull(states);
 
         Assert.False(states.HasGroup(invalidGroup));
@@ -82,10 +73,7 @@ string secondValidValue
         string secondInvalidTag
     )
     {
-        var (_, vis) = VISTests.GetVis();
-        var codebooks = vis.GetCodebooks(VisVersion.v3_4a);
-
-        var codebookType = codebooks[CodebookName.Position];
+        var codebookType = _codebooks[CodebookName.Position];
 
         var metadataTag1 = codebookType.CreateTag(firstTag);
         Assert.Equal(firstTag, metadataTag1);
@@ -116,14 +104,11 @@ string secondInvalidTag
     [Fact]
     public void Test_Get_Groups()
     {
-        var (_, vis) = VISTests.GetVis();
-        var codebooks = vis.GetCodebooks(VisVersion.v3_4a);
-
-        var groups = codebooks[CodebookName.Position].Groups;
+        var groups = _codebooks[CodebookName.Position].Groups;
         Assert.True(groups.Count > 1);
 
         Assert.True(groups.Contains("Vertical"));
-        var rawData = codebooks[CodebookName.Position].RawData;
+        var rawData = _codebooks[CodebookName.Position].RawData;
 
         Assert.Equal(groups.Count, rawData.Count - 1); // -1 because we drop <number> as a group
         Assert.True(rawData.ContainsKey("Vertical"));
@@ -132,8 +117,7 @@ public void Test_Get_Groups()
     [Fact]
     public void Test_Iterate_Groups()
     {
-        var codebooks = VIS.Instance.GetCodebooks(VisVersion.v3_4a);
-        var groups = codebooks[CodebookName.Position].Groups;
+        var groups = _codebooks[CodebookName.Position].Groups;
         var count = 0;
         foreach (var _ in groups)
             count++;
@@ -147,8 +131,7 @@ public void Test_Iterate_Groups()
     [Fact]
     public void Test_Iterate_Values()
     {
-        var codebooks = VIS.Instance.GetCodebooks(VisVersion.v3_4a);
-        var values = codebooks[CodebookName.Position].StandardValues;
+        var values = _codebooks[CodebookName.Position].StandardValues;
         var count = 0;
         foreach (var _ in values)
             count++;
@@ -167,10 +150,7 @@ public void Test_Iterate_Values()
         string secondInvalidCustomTag
     )
     {
-        var (_, vis) = VISTests.GetVis();
-        var codebooks = vis.GetCodebooks(VisVersion.v3_4a);
-
-        var codebook = codebooks[CodebookName.Detail];
+        var codebook = _codebooks[CodebookName.Detail];
         Assert.NotNull(codebook);
 
         Assert.NotNull(codebook.TryCreateTag(validCustomTag));
@@ -4,6 +4,8 @@ namespace Vista.SDK.Tests;
 
 public class GmodPathTests
 {
+    private static readonly Gmod _gmod = VIS.Instance.GetGmod(VisVersion.v3_4a);
+
     public static IEnumerable<string[]> Valid_Test_Data =>
         new string[][]
         {
@@ -25,11 +27,7 @@ public class GmodPathTests
     [MemberData(nameof(Valid_Test_Data))]
     public void Test_GmodPath_Parse(string inputPath)
     {
-        var (_, vis) = VISTests.GetVis();
-
-        var gmod = vis.GetGmod(VisVersion.v3_4a);
-
-        var parsed = GmodPath.TryParse(inputPath, gmod, out var path);
+        var parsed = GmodPath.TryParse(inputPath, _gmod, out var path);
         Assert.True(parsed);
         Assert.NotNull(path);
         Assert.Equal(inputPath, path?.ToString());
@@ -38,10 +36,6 @@ public void Test_GmodPath_Parse(string inputPath)
     [Fact]
     public void Test_GetFullPath()
     {
-        var (_, vis) = VISTests.GetVis();
-
-        var gmod = vis.GetGmod(VisVersion.v3_4a);
-
         var pathStr = "411.1/C101.72/I101";
         var expectation = new Dictionary<int, string>
         {
@@ -59,7 +53,7 @@ public void Test_GetFullPath()
         };
 
         var seen = new HashSet<int>();
-        foreach (var (depth, node) in GmodPath.Parse(pathStr, gmod).GetFullPath())
+        foreach (var (depth, node) in GmodPath.Parse(pathStr, _gmod).GetFullPath())
         {
             if (!seen.Add(depth))
                 Assert.True(false, "Got same depth twice");
@@ -74,10 +68,6 @@ public void Test_GetFullPath()
     [Fact]
     public void Test_GetFullPathFrom()
     {
-        var (_, vis) = VISTests.GetVis();
-
-        var gmod = vis.GetGmod(VisVersion.v3_4a);
-
         var pathStr = "411.1/C101.72/I101";
         var expectation = new Dictionary<int, string>
         {
@@ -91,7 +81,7 @@ public void Test_GetFullPathFrom()
         };
 
         var seen = new HashSet<int>();
-        var path = GmodPath.Parse(pathStr, gmod);
+        var path = GmodPath.Parse(pathStr, _gmod);
         foreach (var (depth, node) in path.GetFullPathFrom(4))
         {
             if (!seen.Add(depth))
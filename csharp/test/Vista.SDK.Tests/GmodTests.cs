@@ -4,6 +4,8 @@ namespace Vista.SDK.Tests;
 
 public class GmodTests
 {
+    private static readonly Gmod _gmod = VIS.Instance.GetGmod(VisVersion.v3_4a);
+
     [Fact]
     public void Test_Gmod_Loads()
     {
@@ -18,13 +20,9 @@ public void Test_Gmod_Loads()
     [Fact]
     public void Test_Gmod_Node_Equality()
     {
-        var (_, vis) = VISTests.GetVis();
-
-        var gmod = vis.GetGmod(VisVersion.v3_4a);
-
-        var node1 = gmod["400a"];
+        var node1 = _gmod["400a"];
 
-        var node2 = gmod["400a"];
+        var node2 = _gmod["400a"];
 
         Assert.Equal(node1, node2);
         Assert.Same(node1, node2);
@@ -41,12 +39,8 @@ public void Test_Gmod_Node_Equality()
     [Fact]
     public void Test_Gmod_Node_Types()
     {
-        var (_, vis) = VISTests.GetVis();
-
-        var gmod = vis.GetGmod(VisVersion.v3_4a);
-
         var set = new HashSet<string>();
-        foreach (var node in gmod)
+        foreach (var node in _gmod)
             set.Add($"{node.Metadata.Category} | {node.Metadata.Type}");
 
         Assert.NotEmpty(set);
@@ -55,11 +49,7 @@ public void Test_Gmod_Node_Types()
     [Fact]
     public void Test_Gmod_RootNode_Children()
     {
-        var (_, vis) = VISTests.GetVis();
-
-        var gmod = vis.GetGmod(VisVersion.v3_4a);
-
-        var node = gmod.RootNode;
+        var node = _gmod.RootNode;
 
         Assert.NotEmpty(node.Children);
     }
@@ -67,41 +57,29 @@ public void Test_Gmod_RootNode_Children()
     [Fact]
     public void Test_Normal_Assignments()
     {
-        var (_, vis) = VISTests.GetVis();
-
-        var gmod = vis.GetGmod(VisVersion.v3_4a);
-
-        var node = gmod["411.3"];
+        var node = _gmod["411.3"];
         Assert.NotNull(node.ProductType);
         Assert.Null(node.ProductSelection);
 
-        node = gmod["H601"];
+        node = _gmod["H601"];
         Assert.Null(node.ProductType);
     }
 
     [Fact]
     public void Test_Node_With_Product_Selection()
     {
-        var (_, vis) = VISTests.GetVis();
-
-        var gmod = vis.GetGmod(VisVersion.v3_4a);
-
-        var node = gmod["411.2"];
+        var node = _gmod["411.2"];
         Assert.NotNull(node.ProductSelection);
         Assert.Null(node.ProductType);
 
-        node = gmod["H601"];
+        node = _gmod["H601"];
         Assert.Null(node.ProductSelection);
     }
 
     [Fact]
     public void Test_Product_Selection()
     {
-        var (_, vis) = VISTests.GetVis();
-
-        var gmod = vis.GetGmod(VisVersion.v3_4a);
-
-        var node = gmod["CS1"];
+        var node = _gmod["CS1"];
         Assert.True(node.IsProductSelection);
     }
 
@@ -123,11 +101,7 @@ public void Test_Product_Selection()
     [InlineData("C101.211", false)]
     public void Test_Mappability(string code, bool mappable)
     {
-        var (_, vis) = VISTests.GetVis();
-
-        var gmod = vis.GetGmod(VisVersion.v3_4a);
-
-        var node = gmod[code];
+        var node = _gmod[code];
 
         Assert.Equal(mappable, node.IsMappable);
     }
@@ -135,38 +109,45 @@ public void Test_Mappability(string code, bool mappable)
     [Fact]
     public void Test_Full_Traversal()
     {
-        var (_, vis) = VISTests.GetVis();
-
-        var gmod = vis.GetGmod(VisVersion.v3_4a);
+        var paths = 0;
 
-        var paths = new List<GmodPath>();
-
-        var completed = gmod.Traverse(
+        var completed = _gmod.Traverse(
             (parents, node) =>
             {
                 Assert.True(parents.Count == 0 || parents[0].IsRoot);
 
-                if (parents.Any(p => p.Code == "HG3") || node.Code == "HG3")
+                // Parents is the traversal's live stack, so validate the path in place
+                // rather than capturing the list in a GmodPath per visit
+                if (node.Code == "411.1" || HasParent(parents, "411.1"))
                 {
-                    paths.Add(new GmodPath(parents, node));
+                    Assert.True(GmodPath.IsValid(parents, node));
+                    paths++;
                 }
 
                 return TraversalHandlerResult.Continue;
             }
         );
         Assert.True(completed);
+        Assert.True(paths > 0);
+
+        static bool HasParent(IReadOnlyList<GmodNode> parents, string code)
+        {
+            for (int i = 0; i < parents.Count; i++)
+            {
+                if (parents[i].Code == code)
+                    return true;
+            }
+
+            return false;
+        }
     }
 
     [Fact]
     public void Test_Partial_Traversal()
     {
-        var (_, vis) = VISTests.GetVis();
-
-        var gmod = vis.GetGmod(VisVersion.v3_4a);
-
         var state = new TraversalState(5) { NodeCount = 0 };
 
-        var completed = gmod.Traverse(
+        var completed = _gmod.Traverse(
             state,
             (state, parents, node) =>
             {
@@ -184,15 +165,11 @@ public void Test_Partial_Traversal()
     [Fact]
     public void Test_Full_Traversal_From()
     {
-        var (_, vis) = VISTests.GetVis();
-
-        var gmod = vis.GetGmod(VisVersion.v3_4a);
-
         var state = new TraversalState(0) { NodeCount = 0 };
 
-        var completed = gmod.Traverse(
+        var completed = _gmod.Traverse(
             state,
-            gmod["400a"],
+            _gmod["400a"],
             (state, parents, node) =>
             {
                 Assert.True(parents.Count == 0 || parents[0].Code == "400a");
@@ -5,6 +5,9 @@ namespace Vista.SDK.Tests;
 
 public class GmodVersioningTests
 {
+    private static readonly Gmod _gmod = VIS.Instance.GetGmod(VisVersion.v3_4a);
+    private static readonly Gmod _targetGmod = VIS.Instance.GetGmod(VisVersion.v3_5a);
+
     private readonly ITestOutputHelper testOutputHelper;
 
     public GmodVersioningTests(ITestOutputHelper testOutputHelper)
@@ -39,27 +42,14 @@ public GmodVersioningTests(ITestOutputHelper testOutputHelper)
     [MemberData(nameof(Valid_Test_Data_Path))]
     public void Test_GmodVersioning_ConvertPath(string inputPath, string expectedPath)
     {
-        var (_, vis) = VISTests.GetVis();
-        var gmod = vis.GetGmod(VisVersion.v3_4a);
-        var targetGmod = vis.GetGmod(VisVersion.v3_5a);
-
-        var sourcePath = GmodPath.Parse(inputPath, gmod);
-        var parsedPath = targetGmod.TryParsePath(expectedPath, out var parsedTargetPath);
-        var targetPath = vis.ConvertPath(VisVersion.v3_4a, sourcePath, VisVersion.v3_5a);
-
-        var nodesWithLocation = sourcePath
-            .GetFullPath()
-            .Where(n => n.Node.Location is not null)
-            .Select(n => n.Node.Code)
-            .ToArray();
-        targetGmod.Traverse(
-            (parents, node) =>
-            {
-                Assert.Null(node.Location);
-                return TraversalHandlerResult.Continue;
-            }
-        );
-        testOutputHelper.WriteLine(sourcePath.ToString());
+        var sourcePath = GmodPath.Parse(inputPath, _gmod);
+        var parsedPath = _targetGmod.TryParsePath(expectedPath, out var parsedTargetPath);
+        var targetPath = VIS.Instance.ConvertPath(VisVersion.v3_4a, sourcePath, VisVersion.v3_5a);
+
+        // Conversion must not leak locations into the shared target gmod nodes
+        foreach (var (_, node) in targetPath.GetFullPath())
+            Assert.Null(_targetGmod[node.Code].Location);
+
         Assert.NotNull(sourcePath);
         Assert.Equal(inputPath, sourcePath?.ToString());
 
@@ -73,16 +63,11 @@ public void Test_GmodVersioning_ConvertPath(string inputPath, string expectedPat
     [Fact(Skip = "Under development")]
     public void SmokeTest_GmodVersioning_ConvertPath()
     {
-        var (_, vis) = VISTests.GetVis();
-
-        var gmod = vis.GetGmod(VisVersion.v3_4a);
-        var targetGmod = vis.GetGmod(VisVersion.v3_5a);
-
         var counter = 0;
         GmodPath? targetPath;
         var failedPaths = new List<Exception>();
 
-        var completed = gmod.Traverse(
+        var completed = _gmod.Traverse(
             (parents, node) =>
             {
                 counter++;
@@ -93,9 +78,9 @@ public void SmokeTest_GmodVersioning_ConvertPath()
                 {
                     var path = new GmodPath(parents, node);
 
-                    targetPath = vis.ConvertPath(VisVersion.v3_4a, path, VisVersion.v3_5a);
+                    targetPath = VIS.Instance.ConvertPath(VisVersion.v3_4a, path, VisVersion.v3_5a);
                     Assert.NotNull(targetPath);
-                    var parsedPath = targetGmod.TryParsePath(
+                    var parsedPath = _targetGmod.TryParsePath(
                         targetPath.ToString(),
                         out var parsedTargetPath
                     );
@@ -136,15 +121,10 @@ public void SmokeTest_GmodVersioning_ConvertPath()
         string expectedCode
     )
     {
-        var (_, vis) = VISTests.GetVis();
-
-        var gmod = vis.GetGmod(VisVersion.v3_4a);
-        var targetGmod = vis.GetGmod(VisVersion.v3_5a);
-
-        var sourceNode = gmod[inputCode] with { Location = location };
-        var expectedNode = targetGmod[expectedCode] with { Location = location };
+        var sourceNode = _gmod[inputCode] with { Location = location };
+        var expectedNode = _targetGmod[expectedCode] with { Location = location };
 
-        var targetNode = vis.ConvertNode(VisVersion.v3_4a, sourceNode, VisVersion.v3_5a);
+        var targetNode = VIS.Instance.ConvertNode(VisVersion.v3_4a, sourceNode, VisVersion.v3_5a);
 
         Assert.Equal(expectedNode.Code, targetNode.Code);
         Assert.Equal(expectedNode.Location, targetNode.Location);
@@ -102,6 +102,24 @@ public async Task Test_DataChannelList_Serialization_Roundtrip(string file)
         package.Should().BeEquivalentTo(deserialized, DataChannelListEquivalency);
     }
 
+    [Fact]
+    public async Task Test_DataChannelList_Serialization_Non_Ascii()
+    {
+        var json = await File.ReadAllTextAsync("Transport/Json/_files/DataChannelList.json");
+        json = json.Replace("\"Author1\"", "\"Ærø Ålesund <A&B>\"");
+
+        var package = Serializer.DeserializeDataChannelList(json);
+        Assert.NotNull(package);
+        Assert.Equal("Ærø Ålesund <A&B>", package!.Package.Header.Author);
+
+        var serialized = package.Serialize();
+        Assert.Contains("Ærø Ålesund", serialized);
+        Assert.Contains("\\u003CA\\u0026B\\u003E", serialized);
+
+        var deserialized = Serializer.DeserializeDataChannelList(serialized);
+        Assert.Equal("Ærø Ålesund <A&B>", deserialized!.Package.Header.Author);
+    }
+
     [Theory]
     [InlineData("Transport/Json/_files/DataChannelList.json")]
     [InlineData("schemas/json/DataChannelList.sample.json")]
@@ -4,15 +4,21 @@ namespace Vista.SDK.Tests;
 
 public class VISTests
 {
-    public static (IServiceProvider ServiceProvider, IVIS Vis) GetVis()
-    {
-        var services = new ServiceCollection();
-        services.AddVIS();
-        var sp = services.BuildServiceProvider();
+    // IVIS is registered as a singleton, so one container is shared by all tests
+    private static readonly Lazy<(IServiceProvider ServiceProvider, IVIS Vis)> _vis =
+        new(
+            () =>
+            {
+                var services = new ServiceCollection();
+                services.AddVIS();
+                var sp = services.BuildServiceProvider();
 
-        var vis = sp.GetRequiredService<IVIS>();
-        return (sp, vis);
-    }
+                var vis = sp.GetRequiredService<IVIS>();
+                return (sp, vis);
+            }
+        );
+
+    public static (IServiceProvider ServiceProvider, IVIS Vis) GetVis() => _vis.Value;
 
     [Fact]
     public void Test_DI()
@@ -38,6 +44,16 @@ public void Test_VersionString()
         Assert.Equal(version, VisVersions.Parse(versionStr));
     }
 
+    [Fact]
+    public void Test_GetVisVersions_Is_ReadOnly()
+    {
+        var versions = VIS.Instance.GetVisVersions();
+
+        Assert.Contains(VisVersion.v3_4a, versions);
+        Assert.False(versions is VisVersion[]);
+        Assert.True(((ICollection<VisVersion>)versions).IsReadOnly);
+    }
+
     [Fact]
     public void Test_EmbeddedResource()
     {
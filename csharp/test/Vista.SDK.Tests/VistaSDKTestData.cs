@@ -21,15 +21,21 @@ public class VistaSDKTestData
     public static IEnumerable<object[]> AddInvalidLocalIdsData() =>
         AddInvalidLocalId(LocalIdTestData);
 
-    private static CodebookTestData CodebookTestData => GetData<CodebookTestData>("Codebook");
-    private static LocalIdTestData LocalIdTestData => GetData<LocalIdTestData>("InvalidLocalIds");
+    // Each MemberData source reads its data on discovery, parse each file only once
+    private static readonly Lazy<CodebookTestData> _codebookTestData =
+        new(() => GetData<CodebookTestData>("Codebook"));
+    private static readonly Lazy<LocalIdTestData> _localIdTestData =
+        new(() => GetData<LocalIdTestData>("InvalidLocalIds"));
+
+    private static CodebookTestData CodebookTestData => _codebookTestData.Value;
+    private static LocalIdTestData LocalIdTestData => _localIdTestData.Value;
 
     private static T GetData<T>(string testName)
     {
         var path = $"testdata/{testName}.json";
-        var testDataJson = File.ReadAllText(path);
+        using var stream = File.OpenRead(path);
 
-        return JsonSerializer.Deserialize<T>(testDataJson)!;
+        return JsonSerializer.Deserialize<T>(stream)!;
     }
 
     public static IEnumerable<object[]> AddCodebookData(string[][] data)
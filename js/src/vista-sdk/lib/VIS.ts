@@ -8,8 +8,10 @@ import { Gmod } from "./Gmod";
 import { Codebooks } from "./Codebooks";
 
 export class VIS {
+    private static _instance: VIS | undefined;
+
     private readonly _gmodDtoCache: LRUCache<VisVersion, Promise<GmodDto>>;
-    private readonly _gmodCache: LRUCache<VisVersion, Gmod>;
+    private readonly _gmodCache: LRUCache<VisVersion, Promise<Gmod>>;
     private readonly _codebooksDtoCache: LRUCache<
         VisVersion,
         Promise<CodebooksDto>
@@ -23,7 +25,10 @@ export class VIS {
         this._codebooksCache = new LRUCache(this.options);
     }
     public static get instance() {
-        return new VIS();
+        if (VIS._instance === undefined) {
+            VIS._instance = new VIS();
+        }
+        return VIS._instance;
     }
     private readonly options = {
         max: 10,
@@ -43,14 +48,17 @@ export class VIS {
     }
 
     public async getGmod(visVersion: VisVersion): Promise<Gmod> {
-        let gmod: Gmod | undefined = this._gmodCache.get(visVersion);
+        let gmod: Promise<Gmod> | undefined = this._gmodCache.get(visVersion);
         if (gmod != undefined) {
-            return gmod;
+            return await gmod;
         }
 
-        gmod = new Gmod(visVersion, await this.getGmodDto(visVersion));
+        // Cache the pending construction so concurrent callers share one Gmod
+        gmod = this.getGmodDto(visVersion).then(
+            (dto) => new Gmod(visVersion, dto)
+        );
         this._gmodCache.set(visVersion, gmod);
-        return gmod;
+        return await gmod;
     }
 
     public async getGmodsMap(